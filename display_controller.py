@@ -4,6 +4,7 @@ import os
 import tkinter as tk
 from tkinter import Y, font as tkFont
 
+import PIL
 from PIL import Image, ImageTk
 
 from hyperpixel_backlight import Backlight
@@ -15,8 +16,50 @@ _LOGGER = logging.getLogger(__name__)
 # and very old versions used Image.ANTIALIAS. Fall back to NEAREST if none found.
 try:
     RESAMPLE_FILTER = Image.Resampling.LANCZOS
+    RESAMPLE_FILTER_FAST = Image.Resampling.BILINEAR
 except AttributeError:
     RESAMPLE_FILTER = getattr(Image, 'LANCZOS', getattr(Image, 'ANTIALIAS', Image.NEAREST))
+    RESAMPLE_FILTER_FAST = getattr(Image, 'BILINEAR', Image.NEAREST)
+
+# Downscales by at least this factor use RESAMPLE_FILTER_FAST, the quality
+# difference is not visible at that ratio but Lanczos costs a lot more on a Pi.
+FAST_RESAMPLE_RATIO = 2
+
+# Pillow 7.0+ can shrink by an integer factor with reduce() before resampling the
+# residual, so the filter kernel only runs over the already reduced image.
+# A gap of 2 reduces by iw // (2 * length) and leaves at least a 2x residual
+# for the filter, the same shrink-then-resample split libvips uses.
+RESIZE_KWARGS = {'reducing_gap': 2.0} if hasattr(Image.Image, 'reduce') else {}
+
+# Pillow-SIMD is a drop-in Pillow replacement with vectorised resampling, its
+# releases carry a ".postN" version suffix.
+PILLOW_SIMD = '.post' in getattr(PIL, '__version__', '')
+
+# Number of resized PhotoImages kept around for re-rendering the same album art
+RESIZE_CACHE_SIZE = 8
+
+# Track name length buckets per show_artist_and_album: names up to the first
+# value are "short", names shorter than the second are "medium", others "long"
+TRACK_NAME_BUCKETS = {True: (27, 34), False: (22, 35)}
+# Detail text longer than this wraps onto a second line
+DETAIL_LONG_MIN = 54
+
+# Detail view layout, (thumbnail size, track font size) keyed by
+# (show_artist_and_album, track name bucket, detail text bucket)
+LAYOUTS = {
+    (True, "short", "empty"): (640, 37),
+    (True, "short", "short"): (620, 27),
+    (True, "short", "long"): (600, 27),
+    (True, "medium", "empty"): (630, 27),
+    (True, "medium", "short"): (630, 22),
+    (True, "medium", "long"): (605, 22),
+    (True, "long", "empty"): (590, 27),
+    (True, "long", "short"): (590, 22),
+    (True, "long", "long"): (565, 22),
+    (False, "short", None): (640, 37),
+    (False, "medium", None): (650, 27),
+    (False, "long", None): (610, 27),
+}
 
 class SonosDisplaySetupError(Exception):
     """Error connecting to Sonos display."""
@@ -53,6 +96,16 @@ class DisplayController:  # pylint: disable=too-many-instance-attributes
         self.timeout_future = None
         self.is_showing = False
 
+        # Resized PhotoImages keyed by (id(source image), length). The source image
+        # is kept in the value so its id cannot be reused while the entry is cached.
+        self._resize_cache = {}
+        self._font_cache = {}
+        self._label_track_font = None
+        self._last_trackname = None
+        self._last_update_key = None
+
+        _LOGGER.debug("Using Pillow %s%s", getattr(PIL, '__version__', '?'), " (SIMD)" if PILLOW_SIMD else "")
+
         self.backlight = Backlight()
         self.touch_controls = touch_controls
         self.touch_callback = touch_callback
@@ -92,8 +145,8 @@ class DisplayController:  # pylint: disable=too-many-instance-attributes
         self.detail_text = tk.StringVar()
         self.play_state_text = tk.StringVar()
 
-        self.detail_font = tkFont.Font(family="consolas", size=14)
-        self.play_state_font = tkFont.Font(family="consolas", size=14)
+        self.detail_font = self._font(14)
+        self.play_state_font = self._font(14)
 
         self.label_albumart = tk.Label(
             self.album_frame,
@@ -133,6 +186,7 @@ class DisplayController:  # pylint: disable=too-many-instance-attributes
         self.label_play_state = tk.Label(
             self.detail_frame,
             textvariable=self.play_state_text,
+            font=self.play_state_font,
             fg="white",
             bg="black",
             wraplength=700,
@@ -158,6 +212,12 @@ class DisplayController:  # pylint: disable=too-many-instance-attributes
         )
         self.label_spotify_code_detail.place(relx=0.75, y=40, anchor=tk.N)
 
+        # Labels are hidden with place_forget() rather than destroyed, track which are placed
+        self._label_visible = {
+            self.label_spotify_code: True,
+            self.label_spotify_code_detail: True,
+        }
+
         self.album_frame.grid_propagate(False)
         self.detail_frame.grid_propagate(False)
 
@@ -171,6 +231,14 @@ class DisplayController:  # pylint: disable=too-many-instance-attributes
 
         self.root.update()
 
+    def _font(self, size, family="consolas"):
+        """Return a shared font, creating it on first use."""
+        key = (family, size)
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._font_cache[key] = tkFont.Font(family=family, size=size)
+        return font
+
     def _on_touch(self, event):
         """Internal handler for touch/click events."""
         _LOGGER.debug('Touch event at %s,%s', event.x, event.y)
@@ -212,25 +280,81 @@ class DisplayController:  # pylint: disable=too-many-instance-attributes
             self.show_album(show_details=False)
 
         self.is_showing = False
+        self._last_update_key = None
         self.backlight.set_power(False)
         self.curtain_frame.lift()
         self.root.update()
-        self.label_spotify_code.destroy()
-        self.label_spotify_code_detail.destroy()
+        self._place_label(self.label_spotify_code, False)
+        self._place_label(self.label_spotify_code_detail, False)
+
+    def _place_label(self, label, visible, **place_args):
+        """Show or hide a label, only calling into Tk when its visibility changes."""
+        if self._label_visible.get(label, False) == visible:
+            return
+        if visible:
+            label.place(**place_args)
+        else:
+            label.place_forget()
+        self._label_visible[label] = visible
+
+    def _layout_key(self, display_trackname, detail_text):
+        """Return the LAYOUTS key for the given track name and detail text."""
+        show_artist_and_album = bool(self.show_artist_and_album)
+        short_max, long_min = TRACK_NAME_BUCKETS[show_artist_and_album]
+        track_len = len(display_trackname)
+        if track_len <= short_max:
+            track_bucket = "short"
+        elif track_len < long_min:
+            track_bucket = "medium"
+        else:
+            track_bucket = "long"
+
+        if not show_artist_and_album:
+            detail_bucket = None
+        elif detail_text == "":
+            detail_bucket = "empty"
+        elif len(detail_text) > DETAIL_LONG_MIN:
+            detail_bucket = "long"
+        else:
+            detail_bucket = "short"
+        return show_artist_and_album, track_bucket, detail_bucket
+
+    def _resize_image(self, image, length):
+        """Resize the image (assumed square) to a PhotoImage, reusing cached results."""
+        key = (id(image), length)
+        cached = self._resize_cache.get(key)
+        if cached:
+            return cached[1]
+
+        source = image
+        if image.mode != "RGB":
+            # Palette images would only get NEAREST resampling and alpha needs extra
+            # premultiply passes, while Tk drops transparency on the black background.
+            image = image.convert("RGB")
+
+        if image.size == (length, length):
+            resized = image
+        else:
+            # Use the compatibility filters selected above.
+            if image.size[0] >= length * FAST_RESAMPLE_RATIO:
+                resample = RESAMPLE_FILTER_FAST
+            else:
+                resample = RESAMPLE_FILTER
+            resized = image.resize((length, length), resample=resample, **RESIZE_KWARGS)
+        photo = ImageTk.PhotoImage(resized)
+        self._resize_cache[key] = (source, photo)
+        while len(self._resize_cache) > RESIZE_CACHE_SIZE:
+            del self._resize_cache[next(iter(self._resize_cache))]
+        return photo
 
     def update(self, code_image, image, sonos_data):
         """Update displayed image and text."""
-
-        def resize_image(image, length):
-            """Resizes the image, assumes square image."""
-            # Use the compatibility RESAMPLE_FILTER selected above.
-            image = image.resize((length, length), resample=RESAMPLE_FILTER)
-            return ImageTk.PhotoImage(image)
-
-        if code_image != None:
-           code_image = ImageTk.PhotoImage(code_image)
-
         display_trackname = sonos_data.trackname or sonos_data.station
+        if display_trackname != self._last_trackname:
+            self._resize_cache.clear()
+            self._last_trackname = display_trackname
+
+        update_key = (id(image), id(code_image))
 
         detail_text = ""
         play_state_text = ""
@@ -260,131 +384,53 @@ class DisplayController:  # pylint: disable=too-many-instance-attributes
 
             play_state_text = " • ".join(filter(None, [play_state_volume_text, play_state_shuffle_text, play_state_repeat_text, play_state_crossfade_text]))
 
-        if self.show_artist_and_album:
-            if len(display_trackname) > 27:
-                if len(detail_text) > 54:
-                    self.THUMB_H = 565
-                    self.THUMB_W = 565
-                else:
-                    self.THUMB_H = 590
-                    self.THUMB_W = 590
-                if detail_text == "":
-                    self.track_font = tkFont.Font(family="consolas", size=27)
-                else:
-                    self.track_font = tkFont.Font(family="consolas", size=22)
-            else:
-                if len(detail_text) > 54:
-                    self.THUMB_H = 600
-                    self.THUMB_W = 600
-                else:
-                    self.THUMB_H = 620
-                    self.THUMB_W = 620
-                if detail_text == "":
-                    self.track_font = tkFont.Font(family="consolas", size=37)
-                    self.THUMB_H = self.THUMB_H + 20
-                    self.THUMB_W = self.THUMB_W + 20
-                else:
-                    self.track_font = tkFont.Font(family="consolas", size=27)
-
-            if len(display_trackname) > 27 and len(display_trackname) < 34:
-                self.THUMB_H = self.THUMB_H + 40
-                self.THUMB_W = self.THUMB_W + 40
-            
-        else:
-            if len(display_trackname) > 22:
-                self.THUMB_H = 610
-                self.THUMB_W = 610
-                self.track_font = tkFont.Font(family="consolas", size=27)
-            else:
-                self.THUMB_H = 640
-                self.THUMB_W = 640
-                self.track_font = tkFont.Font(family="consolas", size=37)
+        # Nothing changed since the last render, just make sure the album is showing
+        update_key = (display_trackname, detail_text, play_state_text) + update_key
+        if update_key == self._last_update_key:
+            self.show_album(self.show_details, self.show_details_timeout)
+            return
+        self._last_update_key = update_key
+
+        if code_image != None:
+           code_image = ImageTk.PhotoImage(code_image)
 
-            if len(display_trackname) > 22 and len(display_trackname) < 35:
-                self.THUMB_H = self.THUMB_H + 40
-                self.THUMB_W = self.THUMB_W + 40
+        thumb_size, font_size = LAYOUTS[self._layout_key(display_trackname, detail_text)]
+        self.THUMB_H = self.THUMB_W = thumb_size
+        self.track_font = self._font(font_size)
 
         # Store the images as attributes to preserve scope for Tk
-        self.album_image = resize_image(image, self.SCREEN_W)
+        self.album_image = self._resize_image(image, self.SCREEN_W)
         if self.overlay_text:
-            self.thumb_image = resize_image(image, self.SCREEN_W)
+            self.thumb_image = self.album_image
             self.label_albumart_detail.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
         else:
-            self.thumb_image = resize_image(image, self.THUMB_W)
+            self.thumb_image = self._resize_image(image, self.THUMB_W)
             self.label_albumart_detail.place(relx=0.5, y=self.THUMB_H / 2, anchor=tk.CENTER)
 
         self.label_track.place(relx=0.5, y=self.THUMB_H + 10, anchor=tk.N)
 
-        if detail_text == "" or not self.show_artist_and_album:
-            self.label_detail.destroy()
-        else:
-            if self.label_detail.winfo_exists() == 0:
-                self.label_detail = tk.Label(
-                    self.detail_frame,
-                    textvariable=self.detail_text,
-                    font=self.detail_font,
-                    fg="white",
-                    bg="black",
-                    wraplength=600,
-                    justify="center",
-                )
-            self.label_detail.place(relx=0.5, y=self.SCREEN_H - 10, anchor=tk.S)
-            self.label_detail.configure(font=self.detail_font)
-
-        if not self.show_play_state:
-            self.label_play_state.destroy()
-        else:
-            if self.label_play_state.winfo_exists() == 0:
-                self.label_play_state = tk.Label(
-                    self.detail_frame,
-                    textvariable=self.play_state_text,
-                    font=self.play_state_font,
-                    fg="white",
-                    bg="black",
-                    wraplength=700,
-                    justify="center",
-                )
-            self.label_play_state.place(relx=0.5, y= 10, anchor=tk.N)
-            self.label_play_state.configure(font=self.play_state_font)
-
-        if not self.show_spotify_code or code_image == None  or detail_text == "":
-            self.label_spotify_code.destroy()
-            self.label_spotify_code_detail.destroy()
-        else:
-            if self.label_spotify_code.winfo_exists() == 0:
-                self.label_spotify_code = tk.Label(
-                    self.album_frame,
-                    image=None,
-                    borderwidth=0,
-                    highlightthickness=0,
-                    fg="white",
-                    bg="#368A7D",
-                )
-                self.label_spotify_code.place(relx=0.75, y=40, anchor=tk.N)
-            if code_image != None:
-                self.label_spotify_code.configure(image=code_image)
-                
-            if self.label_spotify_code_detail.winfo_exists() == 0:
-                self.label_spotify_code_detail = tk.Label(
-                    self.detail_frame,
-                    image=None,
-                    borderwidth=0,
-                    highlightthickness=0,
-                    fg="white",
-                    bg="#368A7D",
-                )
-                self.label_spotify_code_detail.place(relx=0.75, y=40, anchor=tk.N)
-            if code_image != None:
-                self.label_spotify_code_detail.configure(image=code_image) 
+        self._place_label(self.label_detail, detail_text != "" and bool(self.show_artist_and_album),
+                          relx=0.5, y=self.SCREEN_H - 10, anchor=tk.S)
+        self._place_label(self.label_play_state, bool(self.show_play_state), relx=0.5, y=10, anchor=tk.N)
+
+        show_code = bool(self.show_spotify_code) and code_image is not None and detail_text != ""
+        self._place_label(self.label_spotify_code, show_code, relx=0.75, y=40, anchor=tk.N)
+        self._place_label(self.label_spotify_code_detail, show_code, relx=0.75, y=40, anchor=tk.N)
+        if show_code:
+            self.code_image = code_image
+            self.label_spotify_code.configure(image=self.code_image)
+            self.label_spotify_code_detail.configure(image=self.code_image)
 
         self.label_albumart.configure(image=self.album_image)
         self.label_albumart_detail.configure(image=self.thumb_image)
-        self.label_track.configure(font=self.track_font)
+        if self.track_font is not self._label_track_font:
+            self.label_track.configure(font=self.track_font)
+            self._label_track_font = self.track_font
         self.track_name.set(display_trackname)
         self.detail_text.set(detail_text)
         self.play_state_text.set(play_state_text)
-        
-        self.root.update_idletasks()
+
+        # show_album() runs a full root.update(), which also handles idle tasks
         self.show_album(self.show_details, self.show_details_timeout)
 
     def cleanup(self):
@@ -22,6 +22,11 @@ from webhook_handler import SonosWebhook
 from wiim_upnp import get_image_data as get_wiim_image_data
 from wiim_upnp import warmup as wiim_warmup
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 _LOGGER = logging.getLogger(__name__)
 
 try:
@@ -358,7 +363,11 @@ async def cleanup(loop, session, webhook, display):
 
 if __name__ == '__main__':
     # Create and set an explicit event loop to avoid the "There is no current event loop" deprecation warning
-    loop = asyncio.new_event_loop()
+    # Wiim-only mode uses uvloop when installed, like running go_wiim.py directly
+    if uvloop and getattr(sonos_settings, 'wiim_only', False):
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     try:
         # If Wiim-only mode is enabled, run the Wiim entrypoint instead of Sonos flow
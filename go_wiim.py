@@ -3,25 +3,106 @@
 This mirrors the high-res Sonos flow but is driven by the Wiim device directly.
 """
 import asyncio
+import hashlib
+import json
 import logging
+import os
+import re
 import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from io import BytesIO
-import urllib.parse
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from PIL import Image, ImageFile
 
 from display_controller import DisplayController, SonosDisplaySetupError
 import sonos_settings
 import wiim_client
 import wiim_upnp
-from collections import deque
+from wiim_event_handler import WiimEventListener
+from collections import OrderedDict, deque
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 _LOGGER = logging.getLogger(__name__)
 ImageFile.LOAD_TRUNCATED_IMAGES = True
 
+# Album art is only ever shown at the HyperPixel resolution
+ART_SIZE = (720, 720)
+# Seconds between polls while playing, backing off towards POLL_INTERVAL_MAX
+# while the device is stopped or returns empty metadata
+POLL_INTERVAL = 1.0
+POLL_INTERVAL_MAX = 10.0
+# Number of decoded album art images kept by URL
+ART_CACHE_SIZE = 8
+
+# Number of decoded images found by probing the device, kept by track
+TRACK_ART_CACHE_SIZE = 16
+# Probed album art is also kept on disk so restarts do not probe again
+ART_CACHE_DIR = getattr(sonos_settings, 'wiim_art_cache_dir', '~/.cache/wiim_art')
+ART_CACHE_FILES = 256
+
+# Number of tracks whose failed art probes are remembered for the cooldown
+FAILED_ART_CACHE_SIZE = 256
+
+# Placeholder artist/title values that are not worth probing the device for
+_PLACEHOLDER_RE = re.compile(r'unknow|n/a', re.IGNORECASE)
+
+# Seconds to wait for a favorite script running with --daemon to acknowledge a track
+FAVORITE_REPLY_TIMEOUT = 5
+
+# Shown when no album art can be found; DisplayController only reads it, so one instance is shared
+_PLACEHOLDER_IMAGE = Image.new('RGB', ART_SIZE, color='black')
+
+# Prefer JPEG art where the server negotiates, only JPEGs can be draft() decoded
+ART_ACCEPT = 'image/jpeg, image/*;q=0.8'
+
+# url -> (image, etag, last_modified), least recently used first
+_art_cache = OrderedDict()
+# "artist - title" -> image, least recently used first
+_track_art_cache = OrderedDict()
+
+# Album art is decoded (and the disk cache read and written) off the event loop,
+# one job at a time so libjpeg does not compete with the UI for the Pi's cores
+_decode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='art-decode')
+
+
+@dataclass
+class AppState:
+    """Objects owned by main() that the signal handlers need to clean up."""
+    loop: asyncio.AbstractEventLoop = None
+    session: ClientSession = None
+    display: DisplayController = None
+    events: WiimEventListener = None
+    favorite_proc: asyncio.subprocess.Process = None
+    favorite_lock: asyncio.Lock = None
+    favorite_daemon_unsupported: bool = False
+    shutdown_task: asyncio.Task = None
+    signals_installed: bool = False
+
+
+_state = AppState()
+
+
+@dataclass
+class WiimSonosData:
+    """The subset of SonosData fields that DisplayController.update() reads."""
+    trackname: str = ''
+    artist: str = ''
+    album: str = ''
+    station: str = ''
+    volume: object = None
+    shuffle: object = None
+    repeat: object = None
+    crossfade: object = None
+    type: str = 'wiim'
+
 
 def setup_logging_local():
     fmt = "%(asctime)s %(levelname)7s - %(message)s"
@@ -34,41 +115,236 @@ def setup_logging_local():
     logging.getLogger('aiohttp.access').setLevel(logging.WARNING)
 
 
+def _decode_image(data):
+    """Decode image bytes and shrink them to fit ART_SIZE, so cached art stays small.
+
+    libjpeg scales large JPEGs down while decoding; other formats are decoded in
+    full and then reduced.
+    """
+    img = Image.open(BytesIO(data))
+    img.draft('RGB', ART_SIZE)
+    img.thumbnail(ART_SIZE)
+    return img
+
+
+async def _decode_image_async(data):
+    """Decode image bytes on the decode thread so touch and polling stay responsive."""
+    return await asyncio.get_running_loop().run_in_executor(_decode_executor, _decode_image, data)
+
+
 async def fetch_image(session, url):
+    """Return the image at url, revalidating recently fetched art that has an ETag or Last-Modified."""
     if not url:
         return None
+
+    headers = {'Accept': ART_ACCEPT}
+    cached = _art_cache.get(url)
+    if cached:
+        _art_cache.move_to_end(url)
+        image, etag, last_modified = cached
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
     try:
-        async with session.get(url, timeout=5, ssl=False) as resp:
+        async with session.get(url, ssl=False, headers=headers) as resp:
+            if resp.status == 304 and cached:
+                return cached[0]
             if resp.status == 200 and resp.headers.get('content-type', '').startswith('image/'):
-                data = await resp.read()
-                return Image.open(BytesIO(data))
+                data = await wiim_upnp.read_limited(resp, wiim_upnp.MAX_ART_BYTES)
+                if data is None:
+                    _LOGGER.debug('Skipping oversized image %s', url)
+                    return None
+                image = await _decode_image_async(data)
+                etag = resp.headers.get('ETag')
+                last_modified = resp.headers.get('Last-Modified')
+                # Without validators there is no way to tell if art served at a fixed
+                # "now playing" URL has changed, so only revalidatable art is cached
+                if etag or last_modified:
+                    _art_cache[url] = (image, etag, last_modified)
+                    if len(_art_cache) > ART_CACHE_SIZE:
+                        _art_cache.popitem(last=False)
+                else:
+                    _art_cache.pop(url, None)
+                return image
     except Exception as err:
         _LOGGER.debug('Failed to fetch image %s [%s]', url, err)
+        if cached:
+            return cached[0]
     return None
 
 
+def _art_file(key):
+    """Return the disk cache path for a track key, or None if disabled."""
+    if not ART_CACHE_DIR:
+        return None
+    return os.path.join(os.path.expanduser(ART_CACHE_DIR), hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+
+def _read_art_file(key):
+    path = _art_file(key)
+    if not path:
+        return None
+    try:
+        with open(path, 'rb') as art_file:
+            data = art_file.read()
+        # Touch the file so pruning drops the least recently used art, not the oldest written
+        os.utime(path)
+        return data
+    except OSError:
+        return None
+
+
+def _write_art_file(key, data):
+    """Store image bytes as fetched (no re-encoding), dropping the least recently used files over ART_CACHE_FILES."""
+    path = _art_file(key)
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as art_file:
+            art_file.write(data)
+        entries = sorted(os.scandir(os.path.dirname(path)), key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:-ART_CACHE_FILES]:
+            os.remove(entry.path)
+    except OSError as err:
+        _LOGGER.debug('Failed to cache album art in %s [%s]', path, err)
+
+
+async def fetch_track_image(session, artist, title):
+    """Return album art probed from the device for a track, using the memory and disk caches."""
+    key = f"{artist} - {title}"
+    image = _track_art_cache.get(key)
+    if image is not None:
+        _track_art_cache.move_to_end(key)
+        return image
+
+    loop = asyncio.get_running_loop()
+    data = await loop.run_in_executor(_decode_executor, _read_art_file, key)
+    from_disk = data is not None
+    # Art from a URL that doesn't name the track (e.g. /nowplaying.jpg) may still be the
+    # previous track's, so it is shown but not stored against this track
+    per_track = True
+    if not from_disk:
+        _LOGGER.debug('Trying wiim_upnp.get_image for %s', key)
+        data, url = await wiim_upnp.get_image(session, artist, title)
+        if not data:
+            return None
+        per_track = wiim_upnp.is_track_url(url, artist, title)
+
+    try:
+        image = await _decode_image_async(data)
+    except Exception as err:
+        _LOGGER.debug('Failed to decode album art for %s [%s]', key, err)
+        if from_disk:
+            try:
+                await loop.run_in_executor(_decode_executor, os.remove, _art_file(key))
+            except OSError:
+                pass
+        return None
+
+    if not per_track:
+        return image
+    if not from_disk:
+        # Nothing waits on the write (and its pruning scan); it runs after the decode on the same thread
+        loop.run_in_executor(_decode_executor, _write_art_file, key, data)
+    _track_art_cache[key] = image
+    if len(_track_art_cache) > TRACK_ART_CACHE_SIZE:
+        _track_art_cache.popitem(last=False)
+    return image
+
+
+async def _stop_favorite_daemon(terminate=False):
+    """Stop the favorite script daemon, if running, and wait for it to exit."""
+    proc, _state.favorite_proc = _state.favorite_proc, None
+    if proc is None or proc.returncode is not None:
+        return
+    proc.stdin.close()
+    try:
+        if terminate:
+            proc.terminate()
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+    try:
+        await asyncio.wait_for(proc.wait(), FAVORITE_REPLY_TIMEOUT)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+
+
+async def send_favorite(script, info):
+    """Pass track info to a long-running favorite script. Returns False if the script is not running."""
+    if _state.favorite_lock is None:
+        _state.favorite_lock = asyncio.Lock()
+    line = json.dumps({key: info.get(key) or '' for key in ('artist', 'title', 'album')}) + '\n'
+
+    # One request and reply at a time, including (re)starting the daemon
+    async with _state.favorite_lock:
+        proc = _state.favorite_proc
+        if proc is None or proc.returncode is not None:
+            try:
+                proc = await asyncio.create_subprocess_exec(script, '--daemon', stdin=asyncio.subprocess.PIPE,
+                                                            stdout=asyncio.subprocess.PIPE)
+            except OSError as err:
+                _LOGGER.debug('Cannot start favorite script as a daemon [%s]', err)
+                return False
+            _state.favorite_proc = proc
+
+        try:
+            proc.stdin.write(line.encode())
+            await proc.stdin.drain()
+            reply = await asyncio.wait_for(proc.stdout.readline(), FAVORITE_REPLY_TIMEOUT)
+        except asyncio.TimeoutError:
+            # Caught before OSError, which it subclasses from Python 3.11.
+            # The request was delivered, but a late reply would be read as the answer to the
+            # next one, so restart the daemon on the next favorite instead
+            _LOGGER.debug('No reply from favorite script daemon, restarting it')
+            await _stop_favorite_daemon()
+            return True
+        except OSError as err:
+            _LOGGER.debug('Favorite script daemon went away [%s]', err)
+            await _stop_favorite_daemon()
+            return False
+        if not reply:
+            # Don't start it with --daemon again; later favorites run the script once each
+            _LOGGER.info('Favorite script exited, it does not support --daemon')
+            _state.favorite_daemon_unsupported = True
+            await _stop_favorite_daemon()
+            return False
+    _LOGGER.debug('Favorite script daemon replied: %s', reply)
+    return True
+
+
 async def main(loop):
     ImageFile.LOAD_TRUNCATED_IMAGES = True
     # Touch configuration
     touch_enabled = getattr(sonos_settings, 'touch_controls', False)
     touch_detail_timeout = getattr(sonos_settings, 'touch_detail_timeout', None)
 
-    # Maintain latest track info for favorite action
-    latest_info = {}
+    # Latest track info for the favorite action. Rebound (never mutated) on each
+    # poll, so a tap always sees one complete snapshot.
+    latest_info = None
 
-    # recent touch timestamps for multi-tap detection
-    touch_times = deque()
+    # recent touch timestamps for multi-tap detection, only the last three matter
+    touch_times = deque(maxlen=3)
     touch_window = getattr(sonos_settings, 'touch_tap_window', 0.6)
 
     def touch_callback():
         """Handle touch taps: single = show details, double = next, triple = favorite."""
-        now = time.time()
+        # monotonic so clock adjustments (NTP sync on boot) cannot fake a multi-tap
+        now = time.monotonic()
         touch_times.append(now)
-        # drop old taps
-        while touch_times and now - touch_times[0] > touch_window:
-            touch_times.popleft()
-        cnt = len(touch_times)
-        _LOGGER.debug('Touch callback: %d taps in window', cnt)
+        if len(touch_times) == 3 and now - touch_times[0] <= touch_window:
+            cnt = 3
+        elif len(touch_times) >= 2 and now - touch_times[-2] <= touch_window:
+            cnt = 2
+        else:
+            cnt = 1
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug('Touch callback: %d taps in window', cnt)
         if cnt >= 3:
             _LOGGER.info('Touch action: favorite')
             touch_times.clear()
@@ -83,7 +359,8 @@ async def main(loop):
                     _LOGGER.debug('No base or session for next_track')
                     return
                 ok, status, text = await wiim_client.next_track(session, base)
-                _LOGGER.debug('next_track result ok=%s status=%s len_text=%d', ok, status, len(text) if text else 0)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug('next_track result ok=%s status=%s len_text=%d', ok, status, len(text) if text else 0)
                 if not ok:
                     _LOGGER.info('Retrying next_track once')
                     ok2, status2, text2 = await wiim_client.next_track(session, base)
@@ -105,6 +382,9 @@ async def main(loop):
             if not script:
                 _LOGGER.debug('No favorite script configured')
                 return
+            if (getattr(sonos_settings, 'touch_favorite_daemon', False) and not _state.favorite_daemon_unsupported
+                    and await send_favorite(script, info)):
+                return
             args = [script, info.get('artist') or '', info.get('title') or '', info.get('album') or '']
             try:
                 proc = await asyncio.create_subprocess_exec(*args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
@@ -115,8 +395,12 @@ async def main(loop):
         else:
             _LOGGER.debug('Favorite backend %s not implemented', backend)
 
-    # Create aiohttp session early so touch handlers can use it immediately
-    session = ClientSession()
+    # Create aiohttp session early so touch handlers can use it immediately.
+    # Keep connections to the device alive between polls; Wiim devices use
+    # self-signed certificates so verification is disabled for the whole pool.
+    connector = TCPConnector(limit=8, limit_per_host=4, keepalive_timeout=60, ttl_dns_cache=300,
+                             enable_cleanup_closed=True, ssl=False)
+    session = ClientSession(connector=connector, timeout=ClientTimeout(total=5))
 
     # Apply initial brightness and schedule night-dimming task
     def apply_brightness(value):
@@ -188,41 +472,66 @@ async def main(loop):
     base = base_cfg
     if not base:
         _LOGGER.info('No wiim_base_url configured — attempting auto-discovery')
-        try:
-            # warmup will probe discovered devices and cache responsive bases
-            bases = await wiim_upnp.warmup(session, timeout=2)
-            if bases:
-                base = bases[0]
-                _LOGGER.info('Auto-discovered Wiim device: %s', base)
-            else:
-                # As a last attempt, try SSDP discover locations
-                locs = await wiim_upnp.discover_locations(loop=loop, timeout=2)
-                if locs:
-                    parsed = urllib.parse.urlparse(locs[0])
-                    base = f"{parsed.scheme}://{parsed.hostname}:{parsed.port or ('443' if parsed.scheme=='https' else '80')}"
-                    _LOGGER.info('Discovered location via SSDP: %s', base)
-        except Exception as err:
-            _LOGGER.debug('Auto-discovery failed: %s', err)
+        # warmup will probe discovered devices and cache responsive bases; the plain SSDP
+        # search is only a fallback, but runs alongside so a miss doesn't cost another timeout
+        bases, locs = await asyncio.gather(wiim_upnp.warmup(session, timeout=2),
+                                           wiim_upnp.discover_locations(loop=loop, timeout=2),
+                                           return_exceptions=True)
+        if isinstance(bases, Exception):
+            _LOGGER.debug('Auto-discovery failed: %s', bases)
+        elif bases:
+            base = bases[0]
+            _LOGGER.info('Auto-discovered Wiim device: %s', base)
+        if not base:
+            if isinstance(locs, Exception):
+                _LOGGER.debug('SSDP discovery failed: %s', locs)
+            elif locs:
+                base = wiim_upnp.location_base(locs[0])
+                _LOGGER.info('Discovered location via SSDP: %s', base)
 
     if not base:
         _LOGGER.error('No Wiim device discovered and no wiim_base_url configured — exiting')
         await session.close()
         return
 
+    await wiim_client.connect(session, base)
+
+    # Subscribe to UPnP events so the loop only polls when the device reports a change
+    events_enabled = getattr(sonos_settings, 'wiim_events', False)
+    event_port = getattr(sonos_settings, 'wiim_event_port', 8081)
+    event_heartbeat = getattr(sonos_settings, 'wiim_event_heartbeat', 30)
+
+    def start_events(events_base):
+        """Start subscribing in the background; polling continues until events are active."""
+        if not events_enabled:
+            return None
+        listener = WiimEventListener(session, events_base, event_port)
+        listener.start()
+        return listener
+
+    async def wait_for_change(interval):
+        """Sleep until the next poll, waking early when the device sends an event."""
+        if events and events.active:
+            await events.wait(event_heartbeat)
+        else:
+            await asyncio.sleep(interval)
+
+    events = _state.events = start_events(base)
+
     previous_track = None
+    poll_interval = POLL_INTERVAL
     # Cache recent failed artwork lookups to avoid repeated probes (track_id -> timestamp)
-    _failed_art_cache = {}
+    _failed_art_cache = OrderedDict()
     art_failure_cooldown = getattr(sonos_settings, 'art_failure_cooldown', 30)  # seconds
 
     # Track consecutive empty metadata responses for current base and rotate if stuck
     base_empty_count = 0
     base_empty_threshold = getattr(sonos_settings, 'base_empty_threshold', 5)
 
-    def stop_handler():
-        asyncio.ensure_future(cleanup(loop, session, display))
-
-    for signame in ('SIGINT', 'SIGTERM', 'SIGQUIT'):
-        loop.add_signal_handler(getattr(signal, signame), stop_handler)
+    _state.loop = loop
+    _state.session = session
+    _state.display = display
+    _install_signal_handlers(loop)
 
     try:
         while True:
@@ -233,6 +542,7 @@ async def main(loop):
                 _LOGGER.debug('Empty metadata from %s (count=%d)', base, base_empty_count)
                 if base_empty_count >= base_empty_threshold:
                     _LOGGER.info('Base %s returned empty metadata %d times — rotating candidates', base, base_empty_count)
+                    previous_base = base
                     # Try cached bases from wiim_upnp.warmup
                     try:
                         candidates = await wiim_upnp.warmup(session, timeout=2)
@@ -246,28 +556,33 @@ async def main(loop):
                             # Try SSDP discovery for new locations
                             locs = await wiim_upnp.discover_locations(loop=loop, timeout=2)
                             if locs:
-                                parsed = urllib.parse.urlparse(locs[0])
-                                new_base = f"{parsed.scheme}://{parsed.hostname}:{parsed.port or ('443' if parsed.scheme=='https' else '80')}"
+                                new_base = wiim_upnp.location_base(locs[0])
                                 _LOGGER.info('Switching to discovered base %s', new_base)
                                 base = new_base
                                 base_empty_count = 0
                     except Exception as err:
                         _LOGGER.debug('Error rotating bases: %s', err)
+                    if base != previous_base:
+                        if events:
+                            await events.stop()
+                        events = _state.events = start_events(base)
                     # continue to next loop iteration after changing base
                     await asyncio.sleep(0.5)
                     continue
+                poll_interval = min(poll_interval * 2, POLL_INTERVAL_MAX)
             else:
                 base_empty_count = 0
             # publish latest info for touch favorite handling
-            try:
-                latest_info.clear()
-                if isinstance(info, dict):
-                    latest_info.update(info)
-            except Exception:
-                pass
-            _LOGGER.debug('Wiim now playing: %s', info)
+            latest_info = info if isinstance(info, dict) else None
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug('Wiim now playing: %s', info)
             state = (info.get('state') or '').lower()
-            track_id = f"{info.get('artist') or ''} - {info.get('title') or ''}"
+            artist = (info.get('artist') or '').strip()
+            title = (info.get('title') or '').strip()
+            album = (info.get('album') or '').strip()
+            track_id = f"{artist} - {title}"
+            # Some firmwares flip the case of the metadata between polls, which is not a track change
+            track_key = (artist.casefold(), title.casefold())
 
             # Normalize album_art_uri: treat obvious non-URLs as None
             art_uri = info.get('album_art_uri')
@@ -280,11 +595,15 @@ async def main(loop):
                 if state in ('stop', 'stopped', 'idle'):
                     _LOGGER.info('Wiim reported stop/idle state — hiding display')
                     display.hide_album()
-                    await asyncio.sleep(1)
+                    poll_interval = min(poll_interval * 1.5, POLL_INTERVAL_MAX)
+                    await wait_for_change(poll_interval)
                     continue
             except Exception:
                 pass
 
+            if base_empty_count == 0:
+                poll_interval = POLL_INTERVAL
+
             # If the device moved to play and the display is currently hidden, force an update
             try:
                 if state.startswith('play') and not getattr(display, 'is_showing', False):
@@ -292,80 +611,92 @@ async def main(loop):
                     previous_track = None
             except Exception:
                 pass
-            if track_id != previous_track:
-                previous_track = track_id
+            if track_key != previous_track:
+                previous_track = track_key
                 pil_image = None
 
                 # Try WiiM-provided album art URI first
-                if info.get('album_art_uri'):
-                    _LOGGER.debug('Fetching album_art_uri from Wiim: %s', info.get('album_art_uri'))
-                    pil_image = await fetch_image(session, info.get('album_art_uri'))
+                if art_uri:
+                    _LOGGER.debug('Fetching album_art_uri from Wiim: %s', art_uri)
+                    pil_image = await fetch_image(session, art_uri)
 
                 # Next try wiim_upnp.probing (templates + SSDP fallback)
                 if pil_image is None:
                     try:
-                        artist = (info.get('artist') or '').strip()
-                        title = (info.get('title') or '').strip()
                         # Skip obvious placeholders or extremely short names
-                        skip_probe = False
-                        if not artist or not title:
-                            skip_probe = True
-                        low_artist = artist.lower()
-                        low_title = title.lower()
-                        if any(x in low_artist for x in ('unknow', 'unknown', 'n/a')) or any(x in low_title for x in ('unknow', 'unknown', 'n/a')):
-                            skip_probe = True
-
-                        track_key = f"{artist} - {title}"
-                        last_fail = _failed_art_cache.get(track_key)
-                        if last_fail and (time.time() - last_fail) < art_failure_cooldown:
-                            _LOGGER.debug('Skipping art probe for %s (recent failure)', track_key)
+                        skip_probe = (not artist or not title
+                                      or _PLACEHOLDER_RE.search(artist) is not None
+                                      or _PLACEHOLDER_RE.search(title) is not None)
+
+                        last_fail = _failed_art_cache.get(track_id)
+                        if last_fail:
+                            _failed_art_cache.move_to_end(track_id)
+                        if last_fail and (time.monotonic() - last_fail) < art_failure_cooldown:
+                            _LOGGER.debug('Skipping art probe for %s (recent failure)', track_id)
                             skip_probe = True
 
                         if not skip_probe:
-                            _LOGGER.debug('Trying wiim_upnp.get_image_data for %s - %s', artist, title)
-                            data = await wiim_upnp.get_image_data(session, artist, title)
-                            if data:
-                                pil_image = Image.open(BytesIO(data))
-                            else:
-                                _failed_art_cache[track_key] = time.time()
+                            pil_image = await fetch_track_image(session, artist, title)
+                            if pil_image is None:
+                                _failed_art_cache[track_id] = time.monotonic()
+                                _failed_art_cache.move_to_end(track_id)
+                                if len(_failed_art_cache) > FAILED_ART_CACHE_SIZE:
+                                    _failed_art_cache.popitem(last=False)
                     except Exception as err:
-                        _LOGGER.debug('wiim_upnp.get_image_data failed: %s', err)
+                        _LOGGER.debug('wiim_upnp.get_image failed: %s', err)
 
                 if pil_image is None:
                     _LOGGER.debug('No album art found; using placeholder')
-                    pil_image = Image.new('RGB', (720, 720), color='black')
-
-                # create a fake sonos_data-like object for display.update
-                class SD:
-                    pass
-                sd = SD()
-                sd.trackname = info.get('title') or ''
-                sd.artist = info.get('artist') or ''
-                sd.album = info.get('album') or ''
-                sd.station = ''
-                sd.volume = None
-                sd.shuffle = None
-                sd.repeat = None
-                sd.crossfade = None
-                sd.type = 'wiim'
+                    pil_image = _PLACEHOLDER_IMAGE
+
+                # create a sonos_data-like object for display.update
+                sd = WiimSonosData(
+                    trackname=title,
+                    artist=artist,
+                    album=album,
+                )
 
                 display.update(None, pil_image, sd)
 
-            await asyncio.sleep(1)
+            await wait_for_change(poll_interval)
     finally:
-        await cleanup(loop, session, display)
+        await cleanup(loop, session, display, events)
+
+
+def _stop_handler():
+    """Schedule cleanup once, keeping a reference so the task is not collected mid-shutdown."""
+    if _state.shutdown_task is None:
+        _state.shutdown_task = _state.loop.create_task(
+            cleanup(_state.loop, _state.session, _state.display, _state.events))
+
+
+def _install_signal_handlers(loop):
+    """Register the shutdown signal handlers, only once per process."""
+    if _state.signals_installed:
+        return
+    for signame in ('SIGINT', 'SIGTERM', 'SIGQUIT'):
+        if hasattr(signal, signame):
+            loop.add_signal_handler(getattr(signal, signame), _stop_handler)
+    _state.signals_installed = True
 
 
-async def cleanup(loop, session, display):
+async def cleanup(loop, session, display, events=None):
     _LOGGER.debug('Cleaning up')
     display.cleanup()
+    if events:
+        await events.stop()
+    await _stop_favorite_daemon(terminate=True)
     await session.close()
+    await wiim_upnp.close()
+    # Let the connector finish closing its transports before the loop stops
+    await asyncio.sleep(0)
     loop.stop()
 
 
 if __name__ == '__main__':
     # Create and set an explicit event loop to avoid the "There is no current event loop" deprecation warning
-    loop = asyncio.new_event_loop()
+    # uvloop's libuv based loop is quicker for the polling and UPnP sockets, but is optional
+    loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     try:
         loop.create_task(main(loop))
@@ -11,8 +11,14 @@ try:
 except ImportError:
     GPIO = None
 
+try:
+    import pigpio
+except ImportError:
+    pigpio = None
+
 
 BACKLIGHT_PIN = 19
+PWM_FREQUENCY = 1000
 
 
 class Backlight():
@@ -20,6 +26,20 @@ class Backlight():
     def __init__(self, initial_value=False):
         """Initialize the backlight instance."""
         self.power = None
+        self.pwm = None
+        self._pi = None
+
+        # Prefer the SoC's hardware PWM on pin 19 (PWM1) through the pigpio daemon,
+        # RPi.GPIO's PWM is generated by a Python thread and flickers.
+        if pigpio:
+            pi = pigpio.pi(show_errors=False)
+            if pi.connected:
+                self._pi = pi
+                self.active = True
+                self._brightness = 100 if initial_value else 0
+                self.set_power(initial_value)
+                return
+            _LOGGER.debug("pigpio daemon not running, using RPi.GPIO for the backlight")
 
         if not GPIO:
             self.active = False
@@ -49,14 +69,16 @@ class Backlight():
 
     def set_power(self, new_state):
         """Control the backlight power of the HyperPixel display."""
-        if not self.active:
+        if not self.active or new_state == self.power:
             return
 
         if new_state is False and self.power:
             _LOGGER.debug("Going idle, turning backlight off")
         self.power = new_state
         try:
-            if getattr(self, 'pwm', None) is not None:
+            if self._pi is not None:
+                self._hardware_pwm(self._brightness if new_state else 0)
+            elif self.pwm is not None:
                 if new_state:
                     self.pwm.ChangeDutyCycle(self._brightness)
                 else:
@@ -73,17 +95,35 @@ class Backlight():
         if not self.active:
             return
         value = max(0, min(100, int(value)))
+        if value == self._brightness:
+            return
         self._brightness = value
         try:
-            if getattr(self, 'pwm', None) is not None:
+            if self._pi is not None:
+                self._hardware_pwm(value)
+            elif self.pwm is not None:
                 self.pwm.ChangeDutyCycle(value)
             else:
                 GPIO.output(BACKLIGHT_PIN, value >= 50)
         except Exception as err:
             _LOGGER.debug('set_brightness failed: %s', err)
 
+    def _hardware_pwm(self, value):
+        """Set the hardware PWM duty cycle, value is 0..100 (pigpio takes parts per million)."""
+        try:
+            self._pi.hardware_PWM(BACKLIGHT_PIN, PWM_FREQUENCY, int(value * 10000))
+        except pigpio.error as err:
+            raise RuntimeError(err) from err
+
     def cleanup(self):
         """Return the GPIO setup to initial state."""
+        if self._pi is not None:
+            try:
+                self._hardware_pwm(100)
+                self._pi.stop()
+            except Exception as err:
+                _LOGGER.debug("pigpio cleanup failed: %s", err)
+            return
         if self.active:
             try:
                 GPIO.output(BACKLIGHT_PIN, True)
@@ -9,6 +9,12 @@ import asyncio
 from aiohttp import web
 import argparse
 import base64
+import json
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 # tiny 1x1 PNG (white)
 PNG_1x1 = base64.b64decode(
@@ -16,30 +22,34 @@ PNG_1x1 = base64.b64decode(
 )
 
 
-async def handle_state(request):
-    room = request.match_info.get('room', 'Bedroom')
-    # Minimal payload expected by SonosData.refresh
-    payload = {
-        'playbackState': 'PLAYING',
-        'currentTrack': {
-            'type': 'track',
-            'duration': 240,
-            'title': 'Test Track',
-            'artist': 'Test Artist',
-            'album': 'Test Album',
-            'stationName': '',
-            'uri': '',
-            # Provide a full URL to the local test image
-            'albumArtUri': f'http://{request.host}/test.jpg',
-            'absoluteAlbumArtUri': f'http://{request.host}/test.jpg',
-            'nextTrack': {'absoluteAlbumArtUri': f'http://{request.host}/test.jpg'}
-        }
+# Minimal payload expected by SonosData.refresh, serialised once; only the host varies per request
+STATE_TEMPLATE = json.dumps({
+    'playbackState': 'PLAYING',
+    'currentTrack': {
+        'type': 'track',
+        'duration': 240,
+        'title': 'Test Track',
+        'artist': 'Test Artist',
+        'album': 'Test Album',
+        'stationName': '',
+        'uri': '',
+        # Provide a full URL to the local test image
+        'albumArtUri': 'http://__HOST__/test.jpg',
+        'absoluteAlbumArtUri': 'http://__HOST__/test.jpg',
+        'nextTrack': {'absoluteAlbumArtUri': 'http://__HOST__/test.jpg'}
     }
-    return web.json_response(payload)
+}).encode()
+
+IMAGE_HEADERS = {'Cache-Control': 'max-age=3600'}
+
+
+async def handle_state(request):
+    body = STATE_TEMPLATE.replace(b'__HOST__', request.host.encode())
+    return web.Response(body=body, content_type='application/json')
 
 
 async def handle_image(request):
-    return web.Response(body=PNG_1x1, content_type='image/png')
+    return web.Response(body=PNG_1x1, content_type='image/png', headers=IMAGE_HEADERS)
 
 
 def main():
@@ -51,7 +61,10 @@ def main():
     app.router.add_get('/{room}/state', handle_state)
     app.router.add_get('/test.jpg', handle_image)
 
-    web.run_app(app, host='0.0.0.0', port=args.port)
+    # Access logging is off so the mock keeps up with concurrent test clients.
+    # run_app creates its own loop unless given one, so uvloop has to be passed in.
+    loop = uvloop.new_event_loop() if uvloop else None
+    web.run_app(app, host='0.0.0.0', port=args.port, access_log=None, backlog=512, loop=loop)
 
 
 if __name__ == '__main__':
@@ -8,6 +8,11 @@ from aiohttp import web
 import argparse
 import base64
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # tiny 1x1 PNG (blue)
 PNG_1x1 = base64.b64decode(
     b'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMAASsJTYQAAAAASUVORK5CYII='
@@ -28,7 +33,10 @@ def main():
     app.router.add_get('/albumart', albumart)
     app.router.add_get('/nowplaying.jpg', albumart)
 
-    web.run_app(app, host='0.0.0.0', port=args.port)
+    # Access logging is off so the mock keeps up with concurrent test clients.
+    # run_app creates its own loop unless given one, so uvloop has to be passed in.
+    loop = uvloop.new_event_loop() if uvloop else None
+    web.run_app(app, host='0.0.0.0', port=args.port, access_log=None, backlog=512, loop=loop)
 
 
 if __name__ == '__main__':
@@ -7,34 +7,51 @@ dictionary with now-playing info.
 Usage: await wiim_client.get_now_playing(session, base_url)
 base_url may be 'http://ip:port' or just an IP/hostname (https assumed).
 """
+import asyncio
 import logging
 import urllib.parse
+from functools import lru_cache
 
 from aiohttp import ClientError
 import json
 
+try:
+    # orjson parses straight from the response bytes and is much quicker, but is optional
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
 def _normalise_base(base: str) -> str:
     if not base:
         return ''
     base = base.strip()
-    if base.startswith('http://') or base.startswith('https://'):
+    if base.startswith(('http://', 'https://')):
         return base.rstrip('/')
     # Default to http for local LAN devices (more likely to be plain http)
     return f'http://{base.rstrip("/")}'
 
 
+@lru_cache(maxsize=32)
+def _now_playing_urls(base: str):
+    """Return the getMetaInfo and getPlayerStatus URLs for a normalised base."""
+    return (urllib.parse.urljoin(base, '/httpapi.asp?command=getMetaInfo'),
+            urllib.parse.urljoin(base, '/httpapi.asp?command=getPlayerStatus'))
+
+
 async def _fetch_json(session, url, timeout=5, ignore_ssl=True):
     try:
         async with session.get(url, timeout=timeout, ssl=False if ignore_ssl else None) as resp:
-            text = await resp.text()
+            body = await resp.read()
             # Some devices return JSON with wrong content-type (text/html). Try to parse anyway.
             try:
-                return json.loads(text)
-            except json.JSONDecodeError:
-                _LOGGER.debug('Wiim JSON decode failed for %s (status=%s, len=%d)', url, resp.status, len(text) if text else 0)
+                return json_loads(body)
+            except ValueError:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug('Wiim JSON decode failed for %s (status=%s, len=%d)', url, resp.status, len(body))
                 return None
     except ClientError as err:
         _LOGGER.debug('Wiim JSON fetch failed %s [%s]', url, err)
@@ -43,6 +60,18 @@ async def _fetch_json(session, url, timeout=5, ignore_ssl=True):
     return None
 
 
+async def connect(session, base_url, timeout=2):
+    """Open a keep-alive connection to the device so the first poll skips the handshake."""
+    base = _normalise_base(base_url)
+    if not session or not base:
+        return
+    try:
+        async with session.head(base, timeout=timeout, ssl=False):
+            pass
+    except Exception as err:
+        _LOGGER.debug('Wiim connection warmup failed %s [%s]', base, err)
+
+
 async def get_now_playing(session, base_url) -> dict:
     """Return now playing info dict or {} on error.
 
@@ -56,11 +85,10 @@ async def get_now_playing(session, base_url) -> dict:
     if not base:
         return result
 
-    meta_url = urllib.parse.urljoin(base, '/httpapi.asp?command=getMetaInfo')
-    status_url = urllib.parse.urljoin(base, '/httpapi.asp?command=getPlayerStatus')
+    meta_url, status_url = _now_playing_urls(base)
 
-    meta = await _fetch_json(session, meta_url)
-    status = await _fetch_json(session, status_url)
+    # _fetch_json swallows request errors, so both can be awaited together
+    meta, status = await asyncio.gather(_fetch_json(session, meta_url), _fetch_json(session, status_url))
 
     # meta expected to contain metaData.albumArtURI etc.
     try:
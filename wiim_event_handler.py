@@ -0,0 +1,147 @@
+"""Helper class to receive UPnP AVTransport events from a Wiim device."""
+import asyncio
+import logging
+import socket
+import urllib.parse
+
+from aiohttp import web
+
+import wiim_upnp
+
+_LOGGER = logging.getLogger(__name__)
+
+# Renew subscriptions this many seconds before the device would expire them
+RENEW_MARGIN = 60
+# Seconds to wait for the initial event a device sends after a subscription is accepted
+INITIAL_NOTIFY_TIMEOUT = 5
+
+
+def _local_ip_for(host):
+    """Return the local address used to reach host, for the event callback URL."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        # Connecting a UDP socket only selects a route, nothing is sent
+        sock.connect((host, 1900))
+        return sock.getsockname()[0]
+    finally:
+        sock.close()
+
+
+class WiimEventListener:
+    def __init__(self, session, base, port=8081):
+        """Initialize the event listener."""
+        self.session = session
+        self.base = base
+        self.port = port
+        self.changed = asyncio.Event()
+        self.runner = None
+        self.event_url = None
+        self.callback_url = None
+        self.sid = None
+        self.notified = False
+        self._listen_task = None
+        self._renew_task = None
+
+    @property
+    def active(self):
+        """Return True while subscribed and events are known to reach us."""
+        return self.sid is not None and self.notified
+
+    def start(self):
+        """Subscribe in the background, so polling carries on until events are known to arrive."""
+        self._listen_task = asyncio.ensure_future(self._listen())
+
+    async def _listen(self):
+        try:
+            await self.listen()
+        except Exception as err:
+            _LOGGER.debug("Failed to start UPnP event listener: %s", err)
+            await self.stop()
+
+    async def listen(self):
+        """Start the NOTIFY server and subscribe to the device. Returns True on success."""
+        self.event_url = await wiim_upnp.find_event_url(self.session, self.base)
+        if not self.event_url:
+            _LOGGER.info("No UPnP event URL found for %s, polling instead", self.base)
+            return False
+
+        try:
+            host = urllib.parse.urlparse(self.event_url).hostname
+            self.callback_url = f"http://{_local_ip_for(host)}:{self.port}/"
+        except OSError as err:
+            _LOGGER.info("Cannot determine local address for UPnP events [%s], polling instead", err)
+            return False
+
+        app = web.Application()
+        app.add_routes([web.route("NOTIFY", "/", self.handle_notify)])
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "0.0.0.0", self.port)
+        try:
+            await site.start()
+        except OSError as err:
+            _LOGGER.info("Cannot listen for UPnP events on port %s [%s], polling instead", self.port, err)
+            await self.stop()
+            return False
+
+        self.sid, seconds = await wiim_upnp.subscribe(self.session, self.event_url, callback_url=self.callback_url)
+        if not self.sid:
+            _LOGGER.info("Wiim refused UPnP event subscription, polling instead")
+            await self.stop()
+            return False
+
+        # Devices send the current state right after subscribing; without it NOTIFYs are not reaching us
+        try:
+            await asyncio.wait_for(self.changed.wait(), INITIAL_NOTIFY_TIMEOUT)
+        except asyncio.TimeoutError:
+            _LOGGER.info("No UPnP events received at %s, polling instead", self.callback_url)
+            await self.stop()
+            return False
+
+        _LOGGER.info("Subscribed to Wiim UPnP events at %s", self.event_url)
+        self._renew_task = asyncio.ensure_future(self._renew(seconds))
+        return True
+
+    async def _renew(self, seconds):
+        """Keep the subscription alive, resubscribing if the device dropped it."""
+        while True:
+            await asyncio.sleep(max(seconds - RENEW_MARGIN, RENEW_MARGIN))
+            if self.sid:
+                self.sid, seconds = await wiim_upnp.subscribe(self.session, self.event_url, sid=self.sid)
+            if not self.sid:
+                # A new subscription must deliver its initial event again before it is trusted
+                self.notified = False
+                self.sid, seconds = await wiim_upnp.subscribe(self.session, self.event_url, callback_url=self.callback_url)
+                if not self.sid:
+                    _LOGGER.debug("UPnP event subscription lost, polling until it can be renewed")
+
+    async def handle_notify(self, request):
+        """Handle an event NOTIFY sent by the device."""
+        await request.read()
+        self.notified = True
+        self.changed.set()
+        return web.Response(text="OK")
+
+    async def wait(self, timeout):
+        """Wait until the device reports a change or timeout seconds pass."""
+        try:
+            await asyncio.wait_for(self.changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        self.changed.clear()
+
+    async def stop(self):
+        """Unsubscribe and stop the listening server."""
+        task, self._listen_task = self._listen_task, None
+        if task and task is not asyncio.current_task():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        if self._renew_task:
+            self._renew_task.cancel()
+            self._renew_task = None
+        if self.sid:
+            sid, self.sid = self.sid, None
+            await wiim_upnp.unsubscribe(self.session, self.event_url, sid)
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
@@ -9,24 +9,139 @@ Examples in `sonos_settings.py.example` show how to configure the URLs.
 """
 import asyncio
 import logging
+import re
 import socket
 import time
 import urllib.parse
-from typing import List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from xml.etree import ElementTree
 
 from aiohttp import ClientError
 import aiohttp
-import json
 
 import sonos_settings
+from wiim_client import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of tracks whose working album art URL is remembered
+HIT_CACHE_SIZE = 64
+# (artist, track) casefolded -> album art URL that last returned an image for it
+_HIT_CACHE: 'OrderedDict[Tuple[str, str], str]' = OrderedDict()
+
 # Cached responsive base hosts discovered at startup or during warmup
-_CACHED_BASES: List[str] = []
+# (insertion ordered dict used as a set, so adding a base is O(1))
+_CACHED_BASES: Dict[str, None] = {}
+
+# Fallback pooled session for callers that do not pass their own, created on first use
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+# Seconds that non-empty SSDP search results are reused by the album art lookups
+SSDP_CACHE_TTL = 300
+# (mx, st) -> (time.monotonic() of the search, LOCATION URLs)
+_SSDP_CACHE: Dict[Tuple[int, str], Tuple[float, List[str]]] = {}
+# (mx, st) -> search in flight, so concurrent callers share one M-SEARCH
+_SSDP_PENDING: Dict[Tuple[int, str], asyncio.Future] = {}
+
+# Manufacturer/API hints in a device description that mark it as a Wiim (LinkPlay) device
+_HINT_RE = re.compile(rb'linkplay|wii ?m|httpapi\.asp|getmetainfo|getplayerstatus', re.IGNORECASE)
+
+# LOCATION header of an SSDP search response
+_LOCATION_RE = re.compile(rb'^location:[ \t]*(\S+)', re.IGNORECASE | re.MULTILINE)
+
+# SSDP M-SEARCH request, formatted with the MX seconds and the search target
+_MSEARCH_TEMPLATE = (b'M-SEARCH * HTTP/1.1\r\n'
+                     b'HOST: 239.255.255.250:1900\r\n'
+                     b'MAN: "ssdp:discover"\r\n'
+                     b'MX: %d\r\n'
+                     b'ST: %s\r\n'
+                     b'\r\n')
+
+# Always listen this long beyond the MX delay devices may wait before answering a search
+SSDP_MX_MARGIN = 0.5
+# After that, stop an SSDP search once no new device has answered for this many seconds
+SSDP_QUIET_TIME = 0.3
+
+# SSDP search target for the UPnP renderer service that sends LastChange events
+AVTRANSPORT_ST = 'urn:schemas-upnp-org:service:AVTransport:1'
+
+
+@lru_cache(maxsize=16)
+def location_base(location: str) -> str:
+    """Return the scheme://host:port base of an SSDP LOCATION URL."""
+    parsed = urllib.parse.urlparse(location)
+    port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+    return f"{parsed.scheme}://{parsed.hostname}:{port}"
+
+
+def _get_session(session=None):
+    """Return session, or the shared module session if none was given."""
+    global _SESSION
+    if session is not None:
+        return session
+    if _SESSION is None or _SESSION.closed:
+        # Wiim devices use self-signed certificates, so verification is off for the pool
+        connector = aiohttp.TCPConnector(limit=20, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=60,
+                                         enable_cleanup_closed=True, ssl=False)
+        _SESSION = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=5))
+    return _SESSION
+
+
+async def close():
+    """Close the shared module session, if one was created."""
+    global _SESSION
+    if _SESSION is not None:
+        await _SESSION.close()
+        _SESSION = None
+
+
+# Refuse album art larger than this rather than buffering it in memory
+MAX_ART_BYTES = 8 * 1024 * 1024
+
+
+async def read_limited(resp, limit):
+    """Read a response body, returning None if it is larger than limit bytes."""
+    if (resp.content_length or 0) > limit:
+        return None
+    data = bytearray()
+    async for chunk in resp.content.iter_chunked(64 * 1024):
+        data += chunk
+        if len(data) > limit:
+            return None
+    return bytes(data)
+
+
+async def _safe(aw):
+    """Await a probe, returning None instead of raising if it fails."""
+    try:
+        return await aw
+    except Exception as err:
+        _LOGGER.debug('Wiim probe failed [%s]', err)
+        return None
+
+
+async def _first_result(aws, ordered=True):
+    """Run awaitables concurrently and return the first truthy result, cancelling the rest.
 
+    With ordered, results are taken in the order of aws, so an earlier (preferred)
+    probe wins even when a later one answers sooner. Otherwise the fastest wins.
+    """
+    tasks = [asyncio.ensure_future(_safe(aw)) for aw in aws]
+    try:
+        for next_done in (tasks if ordered else asyncio.as_completed(tasks)):
+            result = await next_done
+            if result:
+                return result
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-async def warmup(session, timeout=2):
+
+async def warmup(session=None, timeout=2):
     """Attempt a short discovery/probe pass and cache responsive base hosts.
 
     This should be called once at startup to make per-track lookups fast.
@@ -35,99 +150,69 @@ async def warmup(session, timeout=2):
     """
     global _CACHED_BASES
     if _CACHED_BASES:
-        return _CACHED_BASES
+        return list(_CACHED_BASES)
+    session = _get_session(session)
 
-    bases = []
+    bases = {}
     # If user provided a base in settings, try that first
     cfg_base = getattr(sonos_settings, 'wiim_base_url', '')
     if cfg_base:
-        bases.append(cfg_base)
+        bases[cfg_base] = None
 
     # Do SSDP discovery (blocking portion in executor)
     try:
-        loop = asyncio.get_event_loop()
-        locations = await loop.run_in_executor(None, _sync_ssdp_search, 2, 'ssdp:all', 2)
-        validated_hosts = []
-        for loc in locations:
+        locations = await _cached_ssdp()
+
+        async def validate(loc):
             try:
-                parsed = urllib.parse.urlparse(loc)
                 # Normal base_host from LOCATION
-                base_candidate = f"{parsed.scheme}://{parsed.hostname}:{parsed.port or ('443' if parsed.scheme=='https' else '80')}"
+                base_candidate = location_base(loc)
             except Exception:
-                continue
+                return None
 
             # Try to validate the LOCATION by fetching the description or root document
             try:
                 async with session.get(loc, timeout=3) as resp:
-                    text = await resp.text()
-                    # Look for manufacturer/device hints in the XML/HTML
-                    hint = None
-                    lowered = (text or '').lower()
-                    if 'linkplay' in lowered or 'wiim' in lowered or 'wii m' in lowered:
-                        hint = 'linkplay'
-                    if 'httpapi.asp' in lowered or 'getmetainfo' in lowered or 'getplayerstatus' in lowered:
-                        hint = hint or 'httpapi'
-                    if hint:
-                        validated_hosts.append(base_candidate)
-                        _LOGGER.debug('Validated SSDP location %s as Wiim candidate (hint=%s)', base_candidate, hint)
+                    body = await resp.read()
             except Exception:
                 # ignore individual location fetch failures
-                continue
+                return None
+            # Look for manufacturer/device hints in the XML/HTML
+            hint = _HINT_RE.search(body)
+            if hint:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug('Validated SSDP location %s as Wiim candidate (hint=%s)', base_candidate, hint.group(0))
+                return base_candidate
+            return None
+
+        validated_hosts = await asyncio.gather(*(validate(loc) for loc in locations))
 
         # Append validated hosts after any configured base
-        for h in validated_hosts:
-            if h not in bases:
-                bases.append(h)
+        bases.update(dict.fromkeys(h for h in validated_hosts if h))
     except Exception:
         _LOGGER.debug('SSDP discovery during warmup failed')
 
-    responsive = []
-    for b in bases:
-        try:
-            # First, try to confirm the device exposes the WiiM HTTP API (getMetaInfo)
-            api_ok_base = await _test_httpapi(session, b, timeout=timeout)
-            if api_ok_base:
-                responsive.append(api_ok_base)
-                continue
+    async def probe(b):
+        # First, try to confirm the device exposes the WiiM HTTP API (getMetaInfo)
+        api_ok_base = await _test_httpapi(session, b, timeout=timeout)
+        if api_ok_base:
+            return api_ok_base
 
-            # If API check failed, still try common image paths as a fallback
-            data = await _try_common_paths(session, b, '', '', timeout=timeout)
-            if data:
-                responsive.append(b)
-        except Exception:
-            continue
+        # If API check failed, still try common image paths as a fallback
+        found = await _try_common_paths(session, b, '', '', timeout=timeout)
+        return b if found else None
 
-    _CACHED_BASES = responsive
-    _LOGGER.debug('Wiim warmup cached bases: %s', _CACHED_BASES)
-    return _CACHED_BASES
+    # Probe every base at once, keeping the configured base first
+    responsive = await asyncio.gather(*(_safe(probe(b)) for b in bases))
 
+    _CACHED_BASES = dict.fromkeys(b for b in responsive if b)
+    _LOGGER.debug('Wiim warmup cached bases: %s', list(_CACHED_BASES))
+    return list(_CACHED_BASES)
 
-async def _test_httpapi(session, base: str, timeout=3) -> bool:
-    """Test whether the device at base exposes the /httpapi.asp HTTP API.
 
-    Tries /httpapi.asp?command=getMetaInfo and getPlayerStatus. If the
-    current scheme returns 404 or non-JSON, the function will try the
-    opposite scheme (http <-> https) before returning False.
-    """
-    async def try_one(b):
-        meta_url = urllib.parse.urljoin(b, '/httpapi.asp?command=getMetaInfo')
-        try:
-            async with session.get(meta_url, timeout=timeout, ssl=False) as resp:
-                text = await resp.text()
-                if resp.status == 200:
-                    try:
-                        json.loads(text)
-                        _LOGGER.debug('HTTP API test succeeded at %s', meta_url)
-                        return b
-                    except Exception:
-                        _LOGGER.debug('HTTP API test: JSON decode failed at %s (len=%d)', meta_url, len(text or ''))
-                else:
-                    _LOGGER.debug('HTTP API test: status %s at %s', resp.status, meta_url)
-        except Exception as err:
-            _LOGGER.debug('HTTP API test request failed %s [%s]', meta_url, err)
-        return None
-
-    # Try a set of candidate base variants: as-given, same host without explicit port, alternate scheme with and without port
+@lru_cache(maxsize=128)
+def _base_variants(base: str) -> Tuple[str, ...]:
+    """Return base variants to try: as-given, same host without explicit port, alternate scheme with and without port."""
     parsed = urllib.parse.urlparse(base)
     candidates = []
 
@@ -159,113 +244,303 @@ async def _test_httpapi(session, base: str, timeout=3) -> bool:
             seen.add(c)
             candidates_unique.append(c)
 
-    for c in candidates_unique:
+    return tuple(candidates_unique)
+
+
+async def _test_httpapi(session, base: str, timeout=3) -> bool:
+    """Test whether the device at base exposes the /httpapi.asp HTTP API.
+
+    Tries /httpapi.asp?command=getMetaInfo and getPlayerStatus. If the
+    current scheme returns 404 or non-JSON, the function will try the
+    opposite scheme (http <-> https) before returning False.
+    """
+    async def try_one(b):
+        meta_url = urllib.parse.urljoin(b, '/httpapi.asp?command=getMetaInfo')
         try:
-            ok = await try_one(c)
-            if ok:
-                # Return the working base variant
-                return ok
-        except Exception:
-            continue
+            async with session.get(meta_url, timeout=timeout, ssl=False) as resp:
+                body = await resp.read()
+                if resp.status == 200:
+                    try:
+                        json_loads(body)
+                        _LOGGER.debug('HTTP API test succeeded at %s', meta_url)
+                        return b
+                    except ValueError:
+                        if _LOGGER.isEnabledFor(logging.DEBUG):
+                            _LOGGER.debug('HTTP API test: JSON decode failed at %s (len=%d)', meta_url, len(body))
+                else:
+                    _LOGGER.debug('HTTP API test: status %s at %s', resp.status, meta_url)
+        except Exception as err:
+            _LOGGER.debug('HTTP API test request failed %s [%s]', meta_url, err)
+        return None
 
-    return None
+    # Try every variant at once, but return the working one earliest in the preference order
+    results = await asyncio.gather(*(_safe(try_one(c)) for c in _base_variants(base)))
+    return next((ok for ok in results if ok), None)
+
+
+class _SSDPProtocol(asyncio.DatagramProtocol):
+    """Collect the LOCATION headers of SSDP search responses."""
+
+    def __init__(self):
+        self.locations = []
+        self._seen = set()
+        self.received = asyncio.Event()
+
+    def datagram_received(self, data, addr):
+        for loc in _LOCATION_RE.findall(data):
+            if loc not in self._seen:
+                self._seen.add(loc)
+                self.locations.append(loc.decode('ascii', errors='ignore'))
+                self.received.set()
 
 
-def _sync_ssdp_search(mx=2, st='ssdp:all', timeout=2) -> List[str]:
-    """Perform a simple blocking SSDP M-SEARCH and return list of LOCATION URLs.
+async def _async_ssdp_search(mx=1, st='ssdp:all', timeout=2, quiet=SSDP_QUIET_TIME) -> List[str]:
+    """Perform an SSDP M-SEARCH and return the list of LOCATION URLs.
 
-    This is run in a thread (via run_in_executor) to avoid blocking the async loop.
+    Devices may delay their answer by up to mx seconds, so the search always
+    listens for that long (plus SSDP_MX_MARGIN). After that it returns once
+    no new location has arrived for quiet seconds, or at timeout seconds.
     """
-    MSEARCH_MSG = '\r\n'.join([
-        'M-SEARCH * HTTP/1.1',
-        'HOST: 239.255.255.250:1900',
-        'MAN: "ssdp:discover"',
-        f'MX: {mx}',
-        f'ST: {st}',
-        '',
-        '',
-    ])
-
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    sock.settimeout(timeout)
-
-    locations = []
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(
+        _SSDPProtocol, family=socket.AF_INET, local_addr=('0.0.0.0', 0))
     try:
-        sock.sendto(MSEARCH_MSG.encode('utf-8'), ('239.255.255.250', 1900))
-        start = time.time()
+        transport.sendto(_MSEARCH_TEMPLATE % (mx, st.encode()), ('239.255.255.250', 1900))
+        deadline = loop.time() + timeout
+        await asyncio.sleep(min(mx + SSDP_MX_MARGIN, timeout))
         while True:
-            try:
-                data, addr = sock.recvfrom(1024)
-            except socket.timeout:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
                 break
-            text = data.decode('utf-8', errors='ignore')
-            for line in text.split('\r\n'):
-                if line.lower().startswith('location:'):
-                    loc = line.split(':', 1)[1].strip()
-                    if loc not in locations:
-                        locations.append(loc)
-            if time.time() - start > timeout:
+            protocol.received.clear()
+            wait = quiet if protocol.locations else remaining
+            try:
+                await asyncio.wait_for(protocol.received.wait(), min(wait, remaining))
+            except asyncio.TimeoutError:
                 break
     finally:
-        sock.close()
+        transport.close()
+
+    return protocol.locations
+
 
+async def discover_locations(loop=None, timeout=2, st='ssdp:all') -> List[str]:
+    """Discover UPnP device LOCATION URLs via SSDP. loop is accepted for compatibility and unused.
+
+    Always searches afresh (refreshing the cache), but joins a search already in flight.
+    """
+    return await _cached_ssdp(st=st, timeout=timeout, ttl=0)
+
+
+async def _cached_ssdp(mx=1, st='ssdp:all', timeout=2, ttl=SSDP_CACHE_TTL) -> List[str]:
+    """Return SSDP LOCATION URLs, reusing a recent or in-flight search instead of sending another."""
+    key = (mx, st)
+    cached = _SSDP_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    pending = _SSDP_PENDING.get(key)
+    if pending is None:
+        pending = _SSDP_PENDING[key] = asyncio.ensure_future(_async_ssdp_search(mx, st, timeout))
+        pending.add_done_callback(lambda _: _SSDP_PENDING.pop(key, None))
+    # Shielded so one caller giving up does not cancel the search for the others
+    locations = await asyncio.shield(pending)
+    # Don't remember an empty search, the device may just be booting
+    if locations:
+        _SSDP_CACHE[key] = (time.monotonic(), locations)
     return locations
 
 
-async def discover_locations(loop=None, timeout=2) -> List[str]:
-    """Discover UPnP device LOCATION URLs via SSDP (non-blocking wrapper)."""
-    if loop is None:
-        loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _sync_ssdp_search, 2, 'ssdp:all', timeout)
+def _parse_event_url(location: str, text: str, service: str = 'AVTransport'):
+    """Return the absolute eventSubURL of a service from a UPnP device description."""
+    try:
+        root = ElementTree.fromstring(text)
+    except ElementTree.ParseError:
+        return None
+    for node in root.iter():
+        # Tags are namespaced, e.g. '{urn:schemas-upnp-org:device-1-0}service'
+        if not node.tag.endswith('service'):
+            continue
+        fields = {child.tag.rsplit('}', 1)[-1]: (child.text or '').strip() for child in node}
+        if service in fields.get('serviceType', '') and fields.get('eventSubURL'):
+            return urllib.parse.urljoin(location, fields['eventSubURL'])
+    return None
+
+
+async def find_event_url(session, base: str, loop=None, timeout=2):
+    """Find the AVTransport event URL of the UPnP renderer on the same host as base."""
+    host = urllib.parse.urlparse(base).hostname
+    locations = await discover_locations(loop=loop, timeout=timeout, st=AVTRANSPORT_ST)
+    for loc in locations:
+        if urllib.parse.urlparse(loc).hostname != host:
+            continue
+        try:
+            async with session.get(loc, timeout=timeout) as resp:
+                text = await resp.text()
+        except Exception as err:
+            _LOGGER.debug('Failed to fetch device description %s [%s]', loc, err)
+            continue
+        event_url = _parse_event_url(loc, text)
+        if event_url:
+            _LOGGER.debug('Found AVTransport event URL %s', event_url)
+            return event_url
+    return None
+
+
+async def subscribe(session, event_url: str, callback_url=None, sid=None, timeout=1800):
+    """Subscribe to UPnP events, or renew the subscription when sid is given.
+
+    Returns (sid, granted_seconds), or (None, 0) if the device refused.
+    """
+    headers = {'TIMEOUT': f'Second-{timeout}'}
+    if sid:
+        headers['SID'] = sid
+    else:
+        headers['CALLBACK'] = f'<{callback_url}>'
+        headers['NT'] = 'upnp:event'
+    try:
+        async with session.request('SUBSCRIBE', event_url, headers=headers, timeout=5) as resp:
+            if resp.status != 200:
+                _LOGGER.debug('SUBSCRIBE to %s failed with status %s', event_url, resp.status)
+                return None, 0
+            new_sid = resp.headers.get('SID', sid)
+            granted = resp.headers.get('TIMEOUT', '')
+    except Exception as err:
+        _LOGGER.debug('SUBSCRIBE to %s failed [%s]', event_url, err)
+        return None, 0
+
+    try:
+        seconds = int(granted.lower().replace('second-', ''))
+    except ValueError:
+        # 'Second-infinite' or a missing header
+        seconds = timeout
+    return new_sid, seconds
+
+
+async def unsubscribe(session, event_url: str, sid: str):
+    """Cancel a UPnP event subscription."""
+    try:
+        async with session.request('UNSUBSCRIBE', event_url, headers={'SID': sid}, timeout=5):
+            pass
+    except Exception as err:
+        _LOGGER.debug('UNSUBSCRIBE from %s failed [%s]', event_url, err)
+
+
+# Common album-art endpoint templates tried on a device base URL
+_CANDIDATE_TEMPLATES = (
+    '/albumart?artist={artist}&track={track}',
+    '/albumart.jpg?artist={artist}&track={track}',
+    '/nowplaying/albumart?artist={artist}&track={track}',
+    '/nowplaying.jpg',
+    '/now_playing.jpg',
+    '/image.jpg',
+    '/AlbumArt?artist={artist}&track={track}',
+    '/photo.jpg',
+)
+
+
+@lru_cache(maxsize=256)
+def _build_paths(artist: str, track: str) -> Tuple[str, ...]:
+    """Return the candidate album-art paths for a track."""
+    artist_q = urllib.parse.quote_plus(artist.strip())
+    track_q = urllib.parse.quote_plus(track.strip())
+    return tuple(tpl.format(artist=artist_q, track=track_q) for tpl in _CANDIDATE_TEMPLATES)
+
+
+async def _get_image(session, url: str, timeout=5):
+    """GET url and return the body if the device answered with an image, else None."""
+    async with session.get(url, timeout=timeout) as resp:
+        content_type = resp.headers.get('content-type', '')
+        if content_type.startswith('image/') and resp.status == 200:
+            return await read_limited(resp, MAX_ART_BYTES)
+    return None
 
 
 async def _try_common_paths(session, base: str, artist: str, track: str, timeout=5):
-    """Try a list of common album-art endpoint templates on the device base URL."""
-    artist_q = urllib.parse.quote_plus((artist or '').strip())
-    track_q = urllib.parse.quote_plus((track or '').strip())
-    candidates = [
-        '/albumart?artist={artist}&track={track}',
-        '/albumart.jpg?artist={artist}&track={track}',
-        '/nowplaying/albumart?artist={artist}&track={track}',
-        '/nowplaying.jpg',
-        '/now_playing.jpg',
-        '/image.jpg',
-        '/AlbumArt?artist={artist}&track={track}',
-        '/photo.jpg',
-    ]
-
-    for tpl in candidates:
-        path = tpl.format(artist=artist_q, track=track_q)
-        url = urllib.parse.urljoin(base, path)
+    """Try a list of common album-art endpoint templates on the device base URL.
+
+    Returns (url, image bytes) for the first template that served an image, or None.
+    """
+
+    async def probe(url):
         try:
-            async with session.get(url, timeout=timeout) as resp:
+            # Check with HEAD first so failing candidates don't send an error page body
+            async with session.head(url, timeout=timeout, allow_redirects=True) as resp:
                 content_type = resp.headers.get('content-type', '')
-                if content_type.startswith('image/') and resp.status == 200:
-                    return await resp.read()
-        except ClientError:
-            _LOGGER.debug('Wiim candidate %s failed', url)
-        except Exception:
-            _LOGGER.debug('Wiim candidate %s unexpected error', url)
+                status = resp.status
+            if status not in (405, 501) and not (content_type.startswith('image/') and status == 200):
+                return None
+            # HEAD looked like an image, or isn't supported by the device
+            data = await _get_image(session, url, timeout=timeout)
+            return (url, data) if data else None
+        except ClientError as err:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug('Wiim candidate %s failed [%s]', url, err)
+        except Exception as err:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug('Wiim candidate %s unexpected error [%s]', url, err)
+        return None
+
+    # Probe every candidate at once, preferring the track specific templates listed first
+    found = await _first_result(probe(urllib.parse.urljoin(base, path))
+                                for path in _build_paths(artist or '', track or ''))
+    if not found:
+        return None
+    url, data = found
+    if artist or track:
+        key = ((artist or '').strip().casefold(), (track or '').strip().casefold())
+        _HIT_CACHE[key] = url
+        _HIT_CACHE.move_to_end(key)
+        if len(_HIT_CACHE) > HIT_CACHE_SIZE:
+            _HIT_CACHE.popitem(last=False)
+    return found
 
-    return None
 
+def is_track_url(url: str, artist: str, track: str) -> bool:
+    """Return True if url names the track, so the art it served belongs to that track.
+
+    Generic endpoints such as /nowplaying.jpg serve whatever is playing at the
+    time, which may still be the previous track's art just after a change.
+    """
+    names = [urllib.parse.quote_plus(name.strip()) for name in (artist, track) if name and name.strip()]
+    return bool(url and names) and all(name in url for name in names)
 
-async def get_image_data(session, artist, track, timeout=5):
-    """Return image bytes fetched from the Wiim device or None.
+
+async def get_image_data(session=None, artist='', track='', timeout=5):
+    """Return image bytes fetched from the Wiim device or None."""
+    data, _ = await get_image(session, artist, track, timeout=timeout)
+    return data
+
+
+async def get_image(session=None, artist='', track='', timeout=5):
+    """Return (image bytes, URL they came from) fetched from the Wiim device, or (None, None).
 
     Behaviour:
-    - If `wiim_enabled` is False -> return None
+    - If `wiim_enabled` is False -> return (None, None)
     - If `wiim_albumart_url` is configured -> use it (relative or absolute)
     - Else if `wiim_base_url` is configured -> try a set of common paths
     - Else -> attempt SSDP discovery and try common paths on discovered hosts
     """
     if not getattr(sonos_settings, 'wiim_enabled', False):
-        return None
+        return None, None
 
+    session = _get_session(session)
     artist = (artist or '')
     track = (track or '')
 
+    # Go straight to the URL that served this track last time
+    key = (artist.strip().casefold(), track.strip().casefold())
+    url = _HIT_CACHE.get(key)
+    if url:
+        try:
+            data = await _get_image(session, url, timeout=timeout)
+        except Exception:
+            data = None
+        if data:
+            _HIT_CACHE.move_to_end(key)
+            return data, url
+        _LOGGER.debug('Cached album art URL %s no longer works', url)
+        _HIT_CACHE.pop(key, None)
+
     template = getattr(sonos_settings, 'wiim_albumart_url', '')
     base = getattr(sonos_settings, 'wiim_base_url', '')
 
@@ -277,7 +552,9 @@ async def get_image_data(session, artist, track, timeout=5):
                 async with session.get(url, timeout=timeout) as resp:
                     content_type = resp.headers.get('content-type', '')
                     if content_type.startswith('image/') and resp.status == 200:
-                        return await resp.read()
+                        data = await read_limited(resp, MAX_ART_BYTES)
+                        if data:
+                            return data, url
             except Exception:
                 _LOGGER.debug('Wiim explicit URL failed: %s', url)
         else:
@@ -289,43 +566,48 @@ async def get_image_data(session, artist, track, timeout=5):
                     async with session.get(url, timeout=timeout) as resp:
                         content_type = resp.headers.get('content-type', '')
                         if content_type.startswith('image/') and resp.status == 200:
-                            return await resp.read()
+                            data = await read_limited(resp, MAX_ART_BYTES)
+                            if data:
+                                return data, url
                 except Exception:
                     _LOGGER.debug('Wiim explicit relative URL failed: %s', url)
 
     # If base is configured, try common paths
     if base:
-        data = await _try_common_paths(session, base, artist, track, timeout=timeout)
-        if data:
-            return data
+        found = await _try_common_paths(session, base, artist, track, timeout=timeout)
+        if found:
+            url, data = found
+            return data, url
 
     # Check cached responsive bases first (fast)
-    for b in _CACHED_BASES:
-        try:
-            data = await _try_common_paths(session, b, artist, track, timeout=timeout)
-            if data:
-                return data
-        except Exception:
-            continue
+    found = await _first_result(_try_common_paths(session, b, artist, track, timeout=timeout)
+                                for b in _CACHED_BASES)
+    if found:
+        url, data = found
+        return data, url
 
     # As a last resort, attempt SSDP discovery and try common paths on discovered devices
     try:
-        loop = asyncio.get_event_loop()
-        locations = await loop.run_in_executor(None, _sync_ssdp_search, 2, 'ssdp:all', 2)
+        locations = await _cached_ssdp()
+
+        async def probe(base_host):
+            found = await _try_common_paths(session, base_host, artist, track, timeout=timeout)
+            return (base_host,) + found if found else None
+
+        base_hosts = set()
         for loc in locations:
             # extract scheme+host from loc
             try:
-                parsed = urllib.parse.urlparse(loc)
-                base_host = f"{parsed.scheme}://{parsed.hostname}:{parsed.port or ('443' if parsed.scheme=='https' else '80')}"
+                base_hosts.add(location_base(loc))
             except Exception:
                 continue
-            data = await _try_common_paths(session, base_host, artist, track, timeout=timeout)
-            if data:
-                # cache it for future lookups
-                if base_host not in _CACHED_BASES:
-                    _CACHED_BASES.append(base_host)
-                return data
+        found = await _first_result((probe(base_host) for base_host in base_hosts), ordered=False)
+        if found:
+            base_host, url, data = found
+            # cache it for future lookups
+            _CACHED_BASES[base_host] = None
+            return data, url
     except Exception:
         _LOGGER.debug('Wiim discovery failed')
 
-    return None
+    return None, None